@@ -10,6 +10,7 @@
 
 __neuron__ = [
     "alpha",
+    "grouped",
     "lapicque",
     "leaky",
     "leakyparallel",
@@ -29,6 +30,7 @@ from .synaptic import Synaptic
 
 from .rleaky import RLeaky
 from .rsynaptic import RSynaptic
+from .grouped import GroupedRLeaky
 
 from .sconv2dlstm import SConv2dLSTM
 from .slstm import SLSTM
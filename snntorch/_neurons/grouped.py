@@ -0,0 +1,354 @@
+import math
+
+import torch
+import torch.nn as nn
+
+from .neurons import LIF, _compile
+from .rleaky import _rleaky_step
+
+
+def _grouped(val, num_layers, num_neurons):
+    """Broadcasts a single value, one value per population or one value per
+    neuron to shape `(num_layers, 1, 1 or num_neurons)`."""
+    val = torch.as_tensor(val)
+    if val.dim() == 0:
+        val = val.expand(num_layers)
+    if (
+        val.dim() > 2
+        or val.size(0) != num_layers
+        or val[0].numel() not in (1, num_neurons)
+    ):
+        raise ValueError(
+            "Expected a single value, one value per population of shape "
+            f"({num_layers},) or one value per neuron of shape "
+            f"({num_layers}, {num_neurons}), got shape {tuple(val.shape)}."
+        )
+    return val.reshape(num_layers, 1, -1).clone()
+
+
+def _grouped_rleaky_step(
+    beta, V, threshold, sub_coeff, zero_coeff, reset, spk, mem, input_
+):
+    """Membrane potential update of :class:`GroupedRLeaky` for a single
+    time step, across all stacked populations. A `V` of shape
+    `(num_layers, num_neurons, num_neurons)` is applied as a batched
+    matrix product, laid out as `(out, in)` like the weight of
+    :class:`torch.nn.Linear`; otherwise `V` is an elementwise weight. The
+    rest of the update is shared with :class:`RLeaky`."""
+    if V.size(-2) > 1:
+        recurrent = torch.bmm(spk, V.transpose(-1, -2))
+    else:
+        recurrent = spk * V
+    return _rleaky_step(
+        beta, threshold, sub_coeff, zero_coeff, reset, mem, recurrent, input_
+    )
+
+
+# fuses the recurrence and the update of all populations into a single
+# graph; only used for CUDA tensors where launch overhead dominates
+_grouped_rleaky_step_fused = _compile(_grouped_rleaky_step, fullgraph=True)
+
+
+class GroupedRLeaky(LIF):
+    """
+    A group of `num_layers` independent :class:`RLeaky` populations of
+    `num_neurons` neurons each, whose states are stacked into single tensors
+    of shape `(num_layers, batch, num_neurons)` and updated together.
+
+    Each population follows the same dynamics as :class:`RLeaky` with
+    `reset_delay=True`:
+
+    .. math::
+
+            U_l[t+1] = β_lU_l[t] + I_{{\\rm in}, l}[t+1] +
+            V_l(S_{{\\rm out}, l}[t]) - RU_{\\rm thr}
+
+    Instead of launching a handful of small kernels per layer and per time
+    step, the whole group is advanced with one set of kernels (fused into a
+    single one on CUDA). This only applies to populations that do not feed
+    into one another within a time step, e.g., parallel branches or
+    ensembles, and which share `threshold`, `reset_mechanism`, dtype and
+    device.
+
+    * If `all_to_all = "True"`, then :math:`V_l(\\cdot)` is a dense
+        recurrent matrix of shape `(num_neurons, num_neurons)` per
+        population, applied as :math:`S_{{\\rm out}, l} V_l^T` like the
+        weight of :class:`torch.nn.Linear`. Unlike :class:`RLeaky` with
+        `linear_features`, there is no recurrent bias.
+    * If `all_to_all = "False"`, then :math:`V_l(\\cdot)` acts as an
+        elementwise multiplier with :math:`V_l`.
+
+    Example::
+
+        import torch
+        import snntorch as snn
+
+        num_layers = 4
+        num_neurons = 128
+
+        lif = snn.GroupedRLeaky(beta=0.9, num_layers=num_layers,
+                                num_neurons=num_neurons)
+        spk, mem = lif.reset_mem()
+
+        for step in range(num_steps):
+            # one input current per population, stacked or as a list
+            cur = torch.rand(num_layers, batch_size, num_neurons)
+            spk, mem = lif(cur, spk, mem)
+
+    :param beta: membrane potential decay rate. Clipped between 0 and 1
+        during the forward-pass, or if `learn_beta=False`, once at
+        initialization and when loaded from a state dict. May be a single
+        value, one value per population of shape `(num_layers,)`, or one
+        value per neuron of shape `(num_layers, num_neurons)`.
+    :type beta: float or torch.tensor
+
+    :param num_layers: Number of stacked populations.
+    :type num_layers: int
+
+    :param num_neurons: Number of neurons in each population.
+    :type num_neurons: int
+
+    :param V: Recurrent weights to scale output spikes, only used when
+        `all_to_all=False`. Same shapes as `beta`. Defaults to 1.
+    :type V: float or torch.tensor
+
+    :param all_to_all: Connects the output spikes of each population back
+        to itself through a dense matrix instead of 1-to-1 connections.
+        Defaults to True.
+    :type all_to_all: bool, optional
+
+    :param threshold: Threshold for :math:`mem` to reach in order to
+        generate a spike `S=1`. Defaults to 1
+    :type threshold: float, optional
+
+    :param spike_grad: Surrogate gradient for the term dS/dU. Defaults
+        to None (corresponds to ATan surrogate gradient. See
+        `snntorch.surrogate` for more options)
+    :type spike_grad: surrogate gradient function from snntorch.surrogate,
+        optional
+
+    :param surrogate_disable: Disables surrogate gradients regardless of
+        `spike_grad` argument. Useful for ONNX compatibility. Defaults
+        to False
+    :type surrogate_disable: bool, Optional
+
+    :param init_hidden: Instantiates state variables as instance variables.
+        Defaults to False
+    :type init_hidden: bool, optional
+
+    :param learn_beta: Option to enable learnable beta. Defaults to False
+    :type learn_beta: bool, optional
+
+    :param learn_threshold: Option to enable learnable threshold.
+        Defaults to False
+    :type learn_threshold: bool, optional
+
+    :param learn_recurrent: Option to enable learnable recurrent weights.
+        Defaults to True
+    :type learn_recurrent: bool, optional
+
+    :param reset_mechanism: Defines the reset mechanism applied to
+        :math:`mem` each time the threshold is met.
+        Reset-by-subtraction: "subtract", reset-to-zero: "zero",
+        none: "none". Defaults to "subtract"
+    :type reset_mechanism: str, optional
+
+    :param state_quant: If specified, hidden state :math:`mem` is
+        quantized to a valid state for the forward pass. Defaults to False
+    :type state_quant: quantization function from snntorch.quant, optional
+
+    :param output: If `True` as well as `init_hidden=True`, states are
+        returned when neuron is called. Defaults to False
+    :type output: bool, optional
+
+
+    Inputs: \\input_, spk_0, mem_0
+        - **input_** of shape `(num_layers, batch, num_neurons)`, or a list
+          of `num_layers` tensors of shape `(batch, num_neurons)`: tensor
+          containing input features
+        - **spk_0** of shape `(num_layers, batch, num_neurons)`: tensor
+          containing output spike features
+        - **mem_0** of shape `(num_layers, batch, num_neurons)`: tensor
+          containing the initial membrane potential for each element in
+          the batch.
+
+    Outputs: spk_1, mem_1
+        - **spk_1** of shape `(num_layers, batch, num_neurons)`: tensor
+          containing the output spikes.
+        - **mem_1** of shape `(num_layers, batch, num_neurons)`: tensor
+          containing the next membrane potential for each element in the
+          batch
+
+    Learnable Parameters:
+        - **GroupedRLeaky.beta** (torch.Tensor) - optional learnable
+          weights of shape `(num_layers, 1, 1)` or
+          `(num_layers, 1, num_neurons)`.
+        - **GroupedRLeaky.V** (torch.Tensor) - learnable weights of shape
+          `(num_layers, num_neurons, num_neurons)` if `all_to_all=True`,
+          else of shape `(num_layers, 1, 1)` or
+          `(num_layers, 1, num_neurons)`.
+        - **GroupedRLeaky.threshold** (torch.Tensor) - optional learnable
+          thresholds must be manually passed in.
+
+    """
+
+    _clip_decay = True
+
+    def __init__(
+        self,
+        beta,
+        num_layers,
+        num_neurons,
+        V=1.0,
+        all_to_all=True,
+        threshold=1.0,
+        spike_grad=None,
+        surrogate_disable=False,
+        init_hidden=False,
+        learn_beta=False,
+        learn_threshold=False,
+        learn_recurrent=True,
+        reset_mechanism="subtract",
+        state_quant=False,
+        output=False,
+    ):
+        super().__init__(
+            _grouped(beta, num_layers, num_neurons),
+            threshold,
+            spike_grad,
+            surrogate_disable,
+            init_hidden,
+            False,
+            learn_beta,
+            learn_threshold,
+            reset_mechanism,
+            state_quant,
+            output,
+        )
+
+        self.num_layers = num_layers
+        self.num_neurons = num_neurons
+        self.all_to_all = all_to_all
+        self.learn_recurrent = learn_recurrent
+
+        if self.all_to_all:
+            V = self._init_recurrent_dense()
+        else:
+            V = _grouped(V, num_layers, num_neurons)
+        self._V_register_buffer(V, learn_recurrent)
+
+        self._init_mem()
+        self._reset_coeff()
+
+    def _init_recurrent_dense(self):
+        # same initialization as the weights of `nn.Linear`
+        V = torch.empty(self.num_layers, self.num_neurons, self.num_neurons)
+        for V_layer in V:
+            nn.init.kaiming_uniform_(V_layer, a=math.sqrt(5))
+        return V
+
+    def _init_mem(self):
+        spk = torch.zeros(0)
+        mem = torch.zeros(0)
+
+        self.register_buffer("spk", spk, False)
+        self.register_buffer("mem", mem, False)
+
+        # reset signal for the next step, see `_reset_key`
+        self._next_reset = None
+        self._next_reset_key = None
+
+    def reset_mem(self):
+        self.spk = torch.zeros_like(self.spk)
+        self.mem = torch.zeros_like(self.mem)
+        self._next_reset_key = None
+        return self.spk, self.mem
+
+    def forward(self, input_, spk=None, mem=None):
+        if self.init_hidden and (spk is not None or mem is not None):
+            raise TypeError(
+                "When `init_hidden=True`, GroupedRLeaky expects 1 input "
+                "argument."
+            )
+
+        if not torch.is_tensor(input_):
+            input_ = torch.stack(input_)
+
+        if spk is not None:
+            self.spk = spk
+
+        if mem is not None:
+            self.mem = mem
+
+        if not self.spk.shape == input_.shape:
+            self.spk = torch.zeros_like(input_)
+
+        if not self.mem.shape == input_.shape:
+            self.mem = torch.zeros_like(input_)
+
+        beta = (
+            self.beta.clamp(0, 1)
+            if isinstance(self.beta, nn.Parameter)
+            else self.beta
+        )
+
+        step_fn = (
+            _grouped_rleaky_step_fused
+            if input_.is_cuda
+            else _grouped_rleaky_step
+        )
+
+        # reuse the comparison made by the previous step's spike if valid
+        self.reset = self._cached_reset(self.mem)
+        self.mem = step_fn(
+            beta,
+            self.V,
+            self.threshold,
+            self._sub_coeff,
+            self._zero_coeff,
+            self.reset,
+            self.spk,
+            self.mem,
+            input_,
+        )
+
+        if self.state_quant:
+            self.mem = self.state_quant(self.mem)
+
+        self.spk, self._next_reset = self._fire_with_reset(self.mem)
+        self._next_reset_key = self._reset_key(self.mem)
+
+        if self.output:
+            return self.spk, self.mem
+        elif self.init_hidden:
+            return self.spk
+        else:
+            return self.spk, self.mem
+
+    @classmethod
+    def detach_hidden(cls):
+        """Returns the hidden states, detached from the current graph.
+        Intended for use in truncated backpropagation through time where
+        hidden state variables are instance variables."""
+
+        for layer in cls.instances:
+            if isinstance(layer, GroupedRLeaky):
+                layer.mem.detach_()
+                layer.spk.detach_()
+
+    @classmethod
+    def reset_hidden(cls):
+        """Used to clear hidden state variables to zero.
+        Intended for use where hidden state variables are instance variables.
+        Assumes hidden states have a batch dimension already."""
+
+        layers = [
+            layer
+            for layer in cls.instances
+            if isinstance(layer, GroupedRLeaky)
+        ]
+        cls._zero_hidden(layers, "spk", "mem")
+
+        for layer in layers:
+            # the cached reset belongs to the replaced state
+            layer._next_reset_key = None
@@ -1,3 +1,4 @@
+import functools
 from warnings import warn
 from snntorch.surrogate import atan
 import torch
@@ -12,6 +13,74 @@ __all__ = [
 dtype = torch.float
 
 
+def _compile(fn, **kwargs):
+    """Wraps `fn` with `torch.compile` so that its elementwise ops are fused
+    into a single kernel. Falls back to the eager function where
+    `torch.compile` is unavailable (PyTorch < 2.0, unsupported Python), or
+    where compilation fails on the first call (e.g., no Triton for the
+    GPU), in which case the eager function is used from then on."""
+    if not hasattr(torch, "compile"):
+        return fn
+    try:
+        compiled_fn = torch.compile(fn, **kwargs)
+    except RuntimeError:
+        return fn
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kw):
+        # inside an enclosing compiled region, let it trace `fn` directly
+        if wrapper.eager or _is_compiling():
+            return fn(*args, **kw)
+        try:
+            return compiled_fn(*args, **kw)
+        except Exception as e:
+            # `torch.compile` is lazy, so backend failures only show up
+            # here; errors the eager function raises too are the caller's
+            out = fn(*args, **kw)
+            wrapper.eager = True
+            warn(
+                f"torch.compile failed for {fn.__name__}, falling back to "
+                f"eager execution: {e}",
+                RuntimeWarning,
+            )
+            return out
+
+    wrapper.eager = False
+    return wrapper
+
+
+def _is_compiling():
+    compiler = getattr(torch, "compiler", None)
+    if compiler is not None and hasattr(compiler, "is_compiling"):
+        return compiler.is_compiling()
+    return torch._dynamo.is_compiling()
+
+
+def _apply_reset(mem, reset, threshold, sub_coeff, zero_coeff):
+    """Resets `mem` wherever `reset` is set, by the mechanism encoded in
+    the coefficients of :meth:`SpikingNeuron._reset_coeff`. They are fixed
+    for a layer, so only the term of the active mechanism is computed, as
+    a single `addcmul`; under `torch.compile` the dispatch is resolved when
+    tracing. Reset mechanism "none" returns `mem` as is."""
+    if sub_coeff:
+        return torch.addcmul(mem, reset, threshold, value=-sub_coeff)
+    if zero_coeff:
+        return torch.addcmul(mem, reset, mem, value=-zero_coeff)
+    return mem
+
+
+def _fire_inhibition(spike_grad, mem, threshold):
+    """Functional form of :meth:`SpikingNeuron.fire_inhibition`: generates
+    spikes only for the neuron with the largest membrane potential of each
+    sample. The winner mask is built with a scatter, so the whole function
+    traces into a single graph and the reduction can be fused with the
+    update that produced `mem`."""
+    mem_shift = mem - threshold
+    index = mem_shift.argmax(dim=1, keepdim=True)
+    mask = torch.zeros_like(mem_shift).scatter_(1, index, 1.0)
+    return spike_grad(mem_shift) * mask
+
+
 class SpikingNeuron(nn.Module):
     """Parent class for spiking neuron models."""
 
@@ -99,6 +168,48 @@ class SpikingNeuron(nn.Module):
 
         return spk
 
+    def _fire_with_reset(self, mem):
+        """Generates spike if mem > threshold, along with the detached reset
+        signal that :meth:`mem_reset` would derive from the same mem, so
+        that both come from a single threshold comparison.
+        Returns spk, reset."""
+
+        if self.state_quant:
+            mem = self.state_quant(mem)
+
+        mem_shift = mem - self.threshold
+        spk = self.spike_grad(mem_shift)
+
+        return spk * self.graded_spikes_factor, spk.detach()
+
+    def _reset_key(self, mem):
+        """Identifies what the reset signal of `mem` is derived from, so that
+        one cached alongside a spike is only reused while neither `mem` nor
+        the threshold has been replaced or modified in place. Returns None
+        while compiling, where the comparison is fused anyway and tensor
+        versions cannot be guarded on."""
+        if _is_compiling():
+            return None
+        threshold = self.threshold
+        return mem, mem._version, threshold, threshold._version
+
+    def _cached_reset(self, mem):
+        """Returns the reset signal of `mem`, reusing the one made by the
+        previous step's spike if it is still valid (see :meth:`_reset_key`).
+        """
+        key = self._next_reset_key
+        if key is not None:
+            new_key = self._reset_key(mem)
+            if (
+                new_key is not None
+                and key[0] is new_key[0]
+                and key[1] == new_key[1]
+                and key[2] is new_key[2]
+                and key[3] == new_key[3]
+            ):
+                return self._next_reset
+        return self.mem_reset(mem)
+
     def mem_reset(self, mem):
         """Generates detached reset signal if mem > threshold.
         Returns reset."""
@@ -183,6 +294,18 @@ class SpikingNeuron(nn.Module):
         )
         self.register_buffer("reset_mechanism_val", reset_mechanism_val)
 
+    def _reset_coeff(self):
+        """Precompute the reset mechanism as a pair of scalar flags,
+        `sub_coeff` for "subtract" and `zero_coeff` for "zero", so that the
+        state update does not inspect reset_mechanism_val. Kept as Python
+        numbers, on which :func:`_apply_reset` branches to compute only the
+        term of the active mechanism, and which fold into the `value`
+        multiplier of `torch.addcmul`. Recomputed whenever reset_mechanism
+        is modified."""
+        reset_mechanism_val = int(self.reset_mechanism_val)
+        self._sub_coeff = float(reset_mechanism_val == 0)
+        self._zero_coeff = float(reset_mechanism_val == 1)
+
     def _V_register_buffer(self, V, learn_V):
         if not isinstance(V, torch.Tensor):
             V = torch.as_tensor(V)
@@ -205,6 +328,8 @@ class SpikingNeuron(nn.Module):
             SpikingNeuron.reset_dict[new_reset_mechanism]
         )
         self._reset_mechanism = new_reset_mechanism
+        if hasattr(self, "_sub_coeff"):
+            self._reset_coeff()
 
     @classmethod
     def init(cls):
@@ -227,6 +352,21 @@ class SpikingNeuron(nn.Module):
         for state in args:
             state = torch.zeros_like(state)
 
+    @staticmethod
+    def _zero_hidden(layers, *names):
+        """Clears the hidden states `names` of every layer in `layers` to
+        zero with a single multi-tensor kernel. The states are replaced
+        rather than zeroed in place, as they may still be held by the
+        caller or needed by the backward pass."""
+        states = []
+        for layer in layers:
+            for name in names:
+                state = torch.empty_like(getattr(layer, name))
+                setattr(layer, name, state)
+                states.append(state)
+        if states:
+            torch._foreach_zero_(states)
+
     @staticmethod
     def _surrogate_bypass(input_):
         return (input_ > 0).float()
@@ -271,6 +411,9 @@ class LIF(SpikingNeuron):
         )
         self._reset_mechanism = reset_mechanism
 
+        if self._clip_decay:
+            self._register_load_state_dict_pre_hook(self._clip_decay_hook)
+
     def _lif_register_buffer(
         self,
         beta,
@@ -280,13 +423,30 @@ class LIF(SpikingNeuron):
         buffer."""
         self._beta_buffer(beta, learn_beta)
 
+    # if set, a constant decay rate is clipped to [0, 1] once when it is
+    # registered or loaded from a state dict, so that only learnable ones
+    # are clipped every step; a constant reassigned directly must already
+    # lie in [0, 1]
+    _clip_decay = False
+
     def _beta_buffer(self, beta, learn_beta):
-        if not isinstance(beta, torch.Tensor):
-            beta = torch.as_tensor(beta)  # TODO: or .tensor() if no copy
-        if learn_beta:
-            self.beta = nn.Parameter(beta)
+        self._decay_buffer("beta", beta, learn_beta)
+
+    def _decay_buffer(self, name, decay, learn_decay):
+        if not isinstance(decay, torch.Tensor):
+            decay = torch.as_tensor(decay)  # TODO: or .tensor() if no copy
+        if learn_decay:
+            setattr(self, name, nn.Parameter(decay))
         else:
-            self.register_buffer("beta", beta)
+            if self._clip_decay:
+                decay = decay.clamp(0, 1)
+            self.register_buffer(name, decay)
+
+    def _clip_decay_hook(self, state_dict, prefix, *args):
+        for name in ("alpha", "beta"):
+            key = prefix + name
+            if name in self._buffers and key in state_dict:
+                state_dict[key] = state_dict[key].clamp(0, 1)
 
     def _V_register_buffer(self, V, learn_V):
         if V is not None:
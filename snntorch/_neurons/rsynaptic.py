@@ -1,6 +1,101 @@
 import torch
 import torch.nn as nn
-from .neurons import LIF
+from .neurons import LIF, _apply_reset, _compile, _fire_inhibition
+from .rleaky import RecurrentMatrix
+
+
+def _rsynaptic_step(
+    alpha,
+    beta,
+    threshold,
+    sub_coeff,
+    zero_coeff,
+    reset,
+    syn,
+    mem,
+    recurrent,
+    input_,
+):
+    """Synaptic current and membrane potential update of :class:`RSynaptic`
+    for a single time step. `alpha` and `beta` are expected to be clipped to
+    [0, 1] already. Only the membrane potential is reset, through the
+    precomputed `sub_coeff` and `zero_coeff` (see
+    :meth:`SpikingNeuron._reset_coeff`), so that only the term of the active
+    mechanism is computed and the whole update traces into one graph. The
+    decays and the reset are a single `addcmul` each, which avoids
+    materializing products such as `alpha * syn` and `reset * threshold` as
+    temporaries."""
+    base_fn_syn = torch.addcmul(input_, alpha, syn).add_(recurrent)
+    base_fn_mem = torch.addcmul(base_fn_syn, beta, mem)
+    return base_fn_syn, _apply_reset(
+        base_fn_mem, reset, threshold, sub_coeff, zero_coeff
+    )
+
+
+# fuses the update into a single kernel; only used for CUDA tensors where
+# per-op launch overhead dominates the memory-bound recurrence
+_rsynaptic_step_fused = _compile(_rsynaptic_step, fullgraph=True)
+
+
+def _rsynaptic_step_inhibition(
+    spike_grad,
+    state_quant,
+    alpha,
+    beta,
+    threshold,
+    sub_coeff,
+    zero_coeff,
+    reset,
+    syn,
+    mem,
+    recurrent,
+    input_,
+):
+    """:func:`_rsynaptic_step` followed by the firing of the winning neuron
+    only, for `inhibition=True`. Compiled together, the argmax over the
+    new membrane potential is fused into the kernel that writes it instead
+    of reading it back in a separate pass. Returns spk, syn, mem."""
+    syn, mem = _rsynaptic_step(
+        alpha,
+        beta,
+        threshold,
+        sub_coeff,
+        zero_coeff,
+        reset,
+        syn,
+        mem,
+        recurrent,
+        input_,
+    )
+    if state_quant:
+        syn = state_quant(syn)
+        mem = state_quant(mem)
+    return _fire_inhibition(spike_grad, mem, threshold), syn, mem
+
+
+_rsynaptic_step_inhibition_fused = _compile(
+    _rsynaptic_step_inhibition, fullgraph=True
+)
+
+
+def _rsynaptic_scan(neuron, input_seq):
+    """Steps `neuron` over the leading (time) dimension of `input_seq`.
+    Returns the recorded spikes, synaptic currents and membrane
+    potentials."""
+    spk_rec = []
+    syn_rec = []
+    mem_rec = []
+    for step in range(input_seq.size(0)):
+        neuron(input_seq[step])
+        spk_rec.append(neuron.spk)
+        syn_rec.append(neuron.syn)
+        mem_rec.append(neuron.mem)
+    return torch.stack(spk_rec), torch.stack(syn_rec), torch.stack(mem_rec)
+
+
+# unrolls the whole time-loop into one graph, so the recurrence of a layer
+# is scheduled over the full sequence rather than kernel-by-kernel per step
+_rsynaptic_scan_fused = _compile(_rsynaptic_scan, fullgraph=True)
 
 
 class RSynaptic(LIF):
@@ -113,19 +208,22 @@ class RSynaptic(LIF):
                 return spk2_rec, mem2_rec
 
     :param alpha: synaptic current decay rate. Clipped between 0 and 1
-        during the forward-pass. May be a single-valued tensor (i.e., equal
-        decay rate for all neurons in a layer), or multi-valued (one weight per
-        neuron).
+        during the forward-pass, or if `learn_alpha=False`, once at
+        initialization and when loaded from a state dict. May be a
+        single-valued tensor (i.e., equal decay rate for all neurons in a
+        layer), or multi-valued (one weight per neuron).
     :type alpha: float or torch.tensor
 
     :param beta: membrane potential decay rate. Clipped between 0 and 1
-        during the forward-pass. May be a single-valued tensor (i.e., equal
-        decay rate for all neurons in a layer), or multi-valued (one weight per
-        neuron).
+        during the forward-pass, or if `learn_beta=False`, once at
+        initialization and when loaded from a state dict. May be a
+        single-valued tensor (i.e., equal decay rate for all neurons in a
+        layer), or multi-valued (one weight per neuron).
     :type beta: float or torch.tensor
 
     :param V: Recurrent weights to scale output spikes, only used when
-        `all_to_all=False`. Defaults to 1.
+        `all_to_all=False`. Applied elementwise, or as a dense recurrent
+        matrix if `recurrent_matrix=True`. Defaults to 1.
     :type V: float or torch.tensor
 
     :param all_to_all: Enables output spikes to be connected in dense or
@@ -197,6 +295,20 @@ class RSynaptic(LIF):
         returned when neuron is called. Defaults to False
     :type output: bool, optional
 
+    :param dtype: Reduced precision (e.g., `torch.bfloat16` or
+        `torch.float16`) to run a dense or convolutional recurrence in
+        under :class:`torch.autocast`, i.e., with `all_to_all=True` or
+        `recurrent_matrix=True`. Only takes effect if the recurrent weights
+        are not learnable, in which case they are stored in this `dtype`;
+        the decay rates, an elementwise `V` and the threshold comparison
+        stay in full precision. Intended for inference. Defaults to None
+    :type dtype: torch.dtype, optional
+
+    :param recurrent_matrix: If `True` and `all_to_all=False`, `V` is a
+        square matrix of shape (input_size, input_size) applied as a dense
+        recurrent layer without bias, `F.linear(spk, V)`. Defaults to False
+    :type recurrent_matrix: bool, optional
+
 
     Inputs: \\input_, spk_0, syn_0, mem_0
         - **input_** of shape `(batch, input_size)`: tensor containing input \
@@ -226,13 +338,17 @@ class RSynaptic(LIF):
         `RSynaptic.recurrent` stores a `nn.Linear` or `nn.Conv2d` layer \
         depending on input arguments provided.
         - **RSynaptic.V** (torch.Tensor) - optional learnable weights must \
-        be manually passed in, of shape `1` or (input_size). It is only used \
-        where `all_to_all=False` for 1-to-1 recurrent connections.
+        be manually passed in, of shape `1` or (input_size), or \
+        (input_size, input_size) if `recurrent_matrix=True`. It is only \
+        used where `all_to_all=False` for 1-to-1 or explicit matrix \
+        recurrent connections.
         - **RSynaptic.threshold** (torch.Tensor) - optional learnable \
         thresholds must be manually passed in, of shape `1` or`` (input_size).
 
 """
 
+    _clip_decay = True
+
     def __init__(
         self,
         alpha,
@@ -255,6 +371,8 @@ class RSynaptic(LIF):
         state_quant=False,
         output=False,
         reset_delay=True,
+        dtype=None,
+        recurrent_matrix=False,
     ):
         super().__init__(
             beta,
@@ -272,6 +390,7 @@ class RSynaptic(LIF):
 
         self.all_to_all = all_to_all
         self.learn_recurrent = learn_recurrent
+        self.recurrent_matrix = recurrent_matrix
 
         # linear params
         self.linear_features = linear_features
@@ -294,18 +413,30 @@ class RSynaptic(LIF):
             self._disable_recurrent_grad()
 
         self._alpha_register_buffer(alpha, learn_alpha)
+        self._init_autocast(dtype, learn_recurrent)
 
         self._init_mem()
-
-        if self.reset_mechanism_val == 0:  # reset by subtraction
-            self.state_function = self._base_sub
-        elif self.reset_mechanism_val == 1:  # reset to zero
-            self.state_function = self._base_zero
-        elif self.reset_mechanism_val == 2:  # no reset, pure integration
-            self.state_function = self._base_int
+        self._reset_coeff()
 
         self.reset_delay = reset_delay
 
+        # set by `capture_graph`
+        self._cuda_graph = None
+
+    def _init_autocast(self, dtype, learn_recurrent):
+        self._autocast_dtype = dtype
+
+        # only a dense recurrence benefits from autocast, and only if its
+        # weights are not learned
+        dense = self.all_to_all or self.recurrent_matrix
+        self._autocast = dtype is not None and dense and not learn_recurrent
+        if self._autocast:
+            if self.all_to_all:
+                self.recurrent.to(dtype)
+            else:
+                self.V = self.V.to(dtype)
+                self._init_recurrent_one_to_one()
+
     def _init_mem(self):
         spk = torch.zeros(0)
         syn = torch.zeros(0)
@@ -315,64 +446,241 @@ class RSynaptic(LIF):
         self.register_buffer("syn", syn, False)
         self.register_buffer("mem", mem, False)
 
+        # reset signal for the next step, see `_reset_key`
+        self._next_reset = None
+        self._next_reset_key = None
+
     def reset_mem(self):
-        self.spk = torch.zeros_like(self.spk, device=self.spk.device)
-        self.syn = torch.zeros_like(self.syn, device=self.syn.device)
-        self.mem = torch.zeros_like(self.mem, device=self.mem.device)
+        self.spk = torch.zeros_like(self.spk)
+        self.syn = torch.zeros_like(self.syn)
+        self.mem = torch.zeros_like(self.mem)
+        self._next_reset_key = None
         return self.spk, self.syn, self.mem
 
     def init_rsynaptic(self):
         """Deprecated, use :class:`RSynaptic.reset_mem` instead"""
         return self.reset_mem()
 
+    def forward_sequence(self, input_seq, spk=None, syn=None, mem=None):
+        """Runs the neuron over every time step of `input_seq`, of shape
+        `(num_steps, batch, input_size)`, and returns the output spikes,
+        synaptic currents and membrane potentials of all steps, each of
+        the same shape.
+
+        Equivalent to calling :meth:`forward` once per step. For CUDA
+        inputs the whole time-loop is compiled into a single graph, so
+        that the recurrence is fused across steps instead of launching
+        every kernel once per step. Calling the neuron from a Python
+        time-loop forgoes this: pass the full sequence instead. The
+        compiled graph is specialized to `num_steps`."""
+
+        if self.init_hidden and (
+            spk is not None or syn is not None or mem is not None
+        ):
+            raise TypeError(
+                "When `init_hidden=True`, RSynaptic expects 1 input argument."
+            )
+
+        if spk is not None:
+            self.spk = spk
+
+        if syn is not None:
+            self.syn = syn
+
+        if mem is not None:
+            self.mem = mem
+
+        scan_fn = (
+            _rsynaptic_scan_fused if input_seq.is_cuda else _rsynaptic_scan
+        )
+        return scan_fn(self, input_seq)
+
+    def capture_graph(self, num_steps, example_input):
+        """Captures `num_steps` time steps of the neuron into a CUDA graph,
+        for inputs shaped like `example_input` (a single time step of shape
+        `(batch, input_size)`). :meth:`forward_captured` then runs the
+        whole window with a single graph replay, which removes the CPU-side
+        dispatch cost of every kernel in every step.
+
+        The graph is captured without gradient tracking, so it suits
+        inference or evaluation over fixed-length windows. The hidden
+        states are reset to zero.
+
+        This feature is experimental."""
+
+        if not example_input.is_cuda:
+            raise ValueError("CUDA graphs require `example_input` on CUDA.")
+
+        static_input = example_input.new_zeros(
+            (num_steps, *example_input.shape)
+        )
+        static_spk = torch.zeros_like(example_input)
+        static_syn = torch.zeros_like(example_input)
+        static_mem = torch.zeros_like(example_input)
+
+        # warm up on a side stream before capture, as CUDA graphs require
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream), torch.no_grad():
+            for _ in range(3):
+                self.spk, self.syn, self.mem = (
+                    static_spk,
+                    static_syn,
+                    static_mem,
+                )
+                _rsynaptic_scan(self, static_input)
+        torch.cuda.current_stream().wait_stream(stream)
+
+        graph = torch.cuda.CUDAGraph()
+        self.spk, self.syn, self.mem = static_spk, static_syn, static_mem
+        with torch.cuda.graph(graph), torch.no_grad():
+            spk_rec, syn_rec, mem_rec = _rsynaptic_scan(self, static_input)
+            # carry the final state over to the next replay
+            static_spk.copy_(spk_rec[-1])
+            static_syn.copy_(syn_rec[-1])
+            static_mem.copy_(mem_rec[-1])
+
+        self.spk, self.syn, self.mem = static_spk, static_syn, static_mem
+        self._cuda_graph = (
+            graph,
+            static_input,
+            (static_spk, static_syn, static_mem),
+            (spk_rec, syn_rec, mem_rec),
+        )
+
+    def forward_captured(self, input_seq):
+        """Replays the CUDA graph recorded by :meth:`capture_graph` on
+        `input_seq`, of shape `(num_steps, batch, input_size)`, starting
+        from the current hidden states. Returns the output spikes,
+        synaptic currents and membrane potentials of all steps.
+
+        The returned tensors are static buffers of the graph and are
+        overwritten by the next replay; clone them to keep them."""
+
+        if self._cuda_graph is None:
+            raise RuntimeError(
+                "No CUDA graph has been captured, call `capture_graph` first."
+            )
+
+        graph, static_input, static_states, outputs = self._cuda_graph
+
+        for state, static_state in zip(
+            (self.spk, self.syn, self.mem), static_states
+        ):
+            if state is not static_state:
+                if state.shape == static_state.shape:
+                    static_state.copy_(state)
+                else:
+                    static_state.zero_()
+
+        static_input.copy_(input_seq)
+        graph.replay()
+
+        self.spk, self.syn, self.mem = static_states
+        return outputs
+
     def forward(self, input_, spk=None, syn=None, mem=None):
-        if not spk == None:
+        if spk is not None:
             self.spk = spk
 
-        if not syn == None:
+        if syn is not None:
             self.syn = syn
 
-        if not mem == None:
+        if mem is not None:
             self.mem = mem
 
         if self.init_hidden and (
-            not spk == None or not syn == None or not mem == None
+            spk is not None or syn is not None or mem is not None
         ):
             raise TypeError(
                 "When `init_hidden=True`, RSynaptic expects 1 input argument."
             )
 
         if not self.spk.shape == input_.shape:
-            self.spk = torch.zeros_like(input_, device=self.spk.device)
+            self.spk = torch.zeros_like(input_)
 
         if not self.syn.shape == input_.shape:
-            self.syn = torch.zeros_like(input_, device=self.syn.device)
+            self.syn = torch.zeros_like(input_)
 
         if not self.mem.shape == input_.shape:
-            self.mem = torch.zeros_like(input_, device=self.mem.device)
+            self.mem = torch.zeros_like(input_)
+
+        alpha = (
+            self.alpha.clamp(0, 1)
+            if isinstance(self.alpha, nn.Parameter)
+            else self.alpha
+        )
+        beta = (
+            self.beta.clamp(0, 1)
+            if isinstance(self.beta, nn.Parameter)
+            else self.beta
+        )
 
-        self.reset = self.mem_reset(self.mem)
-        self.syn, self.mem = self.state_function(input_)
+        step_fn = _rsynaptic_step_fused if input_.is_cuda else _rsynaptic_step
 
-        if self.state_quant:
-            self.syn = self.state_quant(self.syn)
-            self.mem = self.state_quant(self.mem)
+        # reuse the comparison made by the previous step's spike if valid
+        self.reset = self._cached_reset(self.mem)
+        if self._autocast:
+            # only the recurrent weights run under autocast; the elementwise
+            # update and threshold stay in full precision
+            with torch.autocast(input_.device.type, self._autocast_dtype):
+                recurrent = self.recurrent(self.spk)
+        else:
+            recurrent = self.recurrent(self.spk)
 
         if self.inhibition:
-            self.spk = self.fire_inhibition(self.mem.size(0), self.mem)
+            inhibition_fn = (
+                _rsynaptic_step_inhibition_fused
+                if input_.is_cuda
+                else _rsynaptic_step_inhibition
+            )
+            self.spk, self.syn, self.mem = inhibition_fn(
+                self.spike_grad,
+                self.state_quant,
+                alpha,
+                beta,
+                self.threshold,
+                self._sub_coeff,
+                self._zero_coeff,
+                self.reset,
+                self.syn,
+                self.mem,
+                recurrent,
+                input_,
+            )
         else:
-            self.spk = self.fire(self.mem)
+            self.syn, self.mem = step_fn(
+                alpha,
+                beta,
+                self.threshold,
+                self._sub_coeff,
+                self._zero_coeff,
+                self.reset,
+                self.syn,
+                self.mem,
+                recurrent,
+                input_,
+            )
+
+            if self.state_quant:
+                self.syn = self.state_quant(self.syn)
+                self.mem = self.state_quant(self.mem)
+
+            self.spk, self._next_reset = self._fire_with_reset(self.mem)
+            self._next_reset_key = self._reset_key(self.mem)
 
         if not self.reset_delay:
             # reset membrane potential _right_ after spike
             do_reset = (
-                spk / self.graded_spikes_factor - self.reset
+                self.spk / self.graded_spikes_factor - self.reset
             )  # avoid double reset
-            if self.reset_mechanism_val == 0:  # reset by subtraction
-                mem = mem - do_reset * self.threshold
-            elif self.reset_mechanism_val == 1:  # reset to zero
-                # mem -= do_reset * mem
-                mem = mem - do_reset * mem
+            self.mem = _apply_reset(
+                self.mem,
+                do_reset,
+                self.threshold,
+                self._sub_coeff,
+                self._zero_coeff,
+            )
 
         if self.output:
             return self.spk, self.syn, self.mem
@@ -409,54 +717,17 @@ class RSynaptic(LIF):
             self.padding = self.kernel_size[0] // 2, self.kernel_size[1] // 2
 
     def _init_recurrent_one_to_one(self):
-        self.recurrent = RecurrentOneToOne(self.V)
+        if self.recurrent_matrix:
+            self.recurrent = RecurrentMatrix(self.V)
+        else:
+            self.recurrent = RecurrentOneToOne(self.V)
 
     def _disable_recurrent_grad(self):
         for param in self.recurrent.parameters():
             param.requires_grad = False
 
-    def _base_state_function(self, input_):
-        base_fn_syn = (
-            self.alpha.clamp(0, 1) * self.syn
-            + input_
-            + self.recurrent(self.spk)
-        )
-        base_fn_mem = self.beta.clamp(0, 1) * self.mem + base_fn_syn
-        return base_fn_syn, base_fn_mem
-
-    def _base_state_reset_zero(self, input_):
-        base_fn_syn = (
-            self.alpha.clamp(0, 1) * self.syn
-            + input_
-            + self.recurrent(self.spk)
-        )
-        base_fn_mem = self.beta.clamp(0, 1) * self.mem + base_fn_syn
-        return 0, base_fn_mem
-
-    def _base_sub(self, input_):
-        syn, mem = self._base_state_function(input_)
-        mem -= self.reset * self.threshold
-        return syn, mem
-
-    def _base_zero(self, input_):
-        syn, mem = self._base_state_function(input_)
-        syn2, mem2 = self._base_state_reset_zero(input_)
-        syn2 *= self.reset
-        mem2 *= self.reset
-        syn -= syn2
-        mem -= mem2
-        return syn, mem
-
-    def _base_int(self, input_):
-        return self._base_state_function(input_)
-
     def _alpha_register_buffer(self, alpha, learn_alpha):
-        if not isinstance(alpha, torch.Tensor):
-            alpha = torch.as_tensor(alpha)
-        if learn_alpha:
-            self.alpha = nn.Parameter(alpha)
-        else:
-            self.register_buffer("alpha", alpha)
+        self._decay_buffer("alpha", alpha, learn_alpha)
 
     def _rsynaptic_init_cases(self):
         all_to_all_bool = bool(self.all_to_all)
@@ -506,27 +777,25 @@ class RSynaptic(LIF):
         Intended for use in truncated backpropagation through time where
         hidden state variables are instance variables."""
 
-        for layer in range(len(cls.instances)):
-            if isinstance(cls.instances[layer], RSynaptic):
-                cls.instances[layer].syn.detach_()
-                cls.instances[layer].mem.detach_()
+        for layer in cls.instances:
+            if isinstance(layer, RSynaptic):
+                layer.spk.detach_()
+                layer.syn.detach_()
+                layer.mem.detach_()
 
     @classmethod
     def reset_hidden(cls):
         """Used to clear hidden state variables to zero.
         Intended for use where hidden state variables are instance
         variables."""
-
-        for layer in range(len(cls.instances)):
-            if isinstance(cls.instances[layer], RSynaptic):
-                cls.instances[layer].syn = torch.zeros_like(
-                    cls.instances[layer].syn,
-                    device=cls.instances[layer].syn.device,
-                )
-                cls.instances[layer].mem = torch.zeros_like(
-                    cls.instances[layer].mem,
-                    device=cls.instances[layer].mem.device,
-                )
+        layers = [
+            layer for layer in cls.instances if isinstance(layer, RSynaptic)
+        ]
+        cls._zero_hidden(layers, "spk", "syn", "mem")
+
+        for layer in layers:
+            # the cached reset belongs to the replaced state
+            layer._next_reset_key = None
 
 
 class RecurrentOneToOne(nn.Module):
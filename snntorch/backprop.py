@@ -149,6 +149,7 @@ def TBPTT(
         utils.is_synaptic: snn.Synaptic,
         utils.is_alpha: snn.Alpha,
         utils.is_rleaky: snn.RLeaky,
+        utils.is_grouped_rleaky: snn.GroupedRLeaky,
         utils.is_rsynaptic: snn.RSynaptic,
         utils.is_sconv2dlstm: snn.SConv2dLSTM,
         utils.is_slstm: snn.SLSTM,
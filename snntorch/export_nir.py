@@ -128,8 +128,10 @@ def _extract_snntorch_module(module: torch.nn.Module) -> Optional[nir.NIRNode]:
                 raise ValueError(
                     "V must be a vector, cannot infer layer size for scalar V"
                 )
-            n_neurons = module.recurrent.V.shape[0]
-            w = np.diag(module.recurrent.V.data.detach().numpy())
+            w = module.recurrent.V.data.detach().numpy()
+            if not module.recurrent_matrix:
+                w = np.diag(w.flatten())
+            n_neurons = w.shape[0]
             w_rec = nir.Linear(weight=w)
 
         dt = 1e-4
@@ -148,6 +148,7 @@ def reset(net):
     global is_leaky
     global is_lapicque
     global is_rleaky
+    global is_grouped_rleaky
     global is_synaptic
     global is_rsynaptic
     global is_sconv2dlstm
@@ -156,6 +157,7 @@ def reset(net):
     is_alpha = False
     is_leaky = False
     is_rleaky = False
+    is_grouped_rleaky = False
     is_synaptic = False
     is_rsynaptic = False
     is_lapicque = False
@@ -175,6 +177,7 @@ def _layer_check(net):
     global is_synaptic
     global is_alpha
     global is_rleaky
+    global is_grouped_rleaky
     global is_rsynaptic
     global is_sconv2dlstm
     global is_slstm
@@ -190,6 +193,8 @@ def _layer_check(net):
             is_alpha = True
         if isinstance(list(net._modules.values())[idx], snn.RLeaky):
             is_rleaky = True
+        if isinstance(list(net._modules.values())[idx], snn.GroupedRLeaky):
+            is_grouped_rleaky = True
         if isinstance(list(net._modules.values())[idx], snn.RSynaptic):
             is_rsynaptic = True
         if isinstance(list(net._modules.values())[idx], snn.SConv2dLSTM):
@@ -217,6 +222,9 @@ def _layer_reset():
     if is_rleaky:
         snn.RLeaky.reset_hidden()  # reset hidden state to 0's
         snn.RLeaky.detach_hidden()
+    if is_grouped_rleaky:
+        snn.GroupedRLeaky.reset_hidden()  # reset hidden state to 0's
+        snn.GroupedRLeaky.detach_hidden()
     if is_rsynaptic:
         snn.RSynaptic.reset_hidden()  # reset hidden state to 0's
         snn.RSynaptic.detach_hidden()
@@ -241,6 +249,8 @@ def _final_layer_check(net):
         return 2
     if isinstance(list(net._modules.values())[-1], snn.RLeaky):
         return 2
+    if isinstance(list(net._modules.values())[-1], snn.GroupedRLeaky):
+        return 2
     if isinstance(list(net._modules.values())[-1], snn.SConv2dLSTM):
         return 3
     if isinstance(list(net._modules.values())[-1], snn.SLSTM):
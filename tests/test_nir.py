@@ -147,6 +147,23 @@ class TestNIR:
             ]
         )
 
+    def test_export_recurrent_matrix_V(self, sample_data):
+        v = torch.rand((500, 500))
+        net = torch.nn.Sequential(
+            torch.nn.Linear(784, 500),
+            snn.RSynaptic(
+                alpha=0.5,
+                beta=0.9,
+                V=v,
+                all_to_all=False,
+                recurrent_matrix=True,
+                init_hidden=True,
+            ),
+        )
+        nir_graph = snn.export_to_nir(net, sample_data)
+        assert nir_graph is not None
+        assert (nir_graph.nodes["1.w_rec"].weight == v.numpy()).all()
+
     def test_import_nir(self):
         graph = nir.read("tests/lif.nir")
         net = snn.import_from_nir(graph)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+"""Tests for GroupedRLeaky neuron."""
+
+import pytest
+import snntorch as snn
+from snntorch import utils
+import torch
+from snntorch._neurons.grouped import (
+    _grouped_rleaky_step,
+    _grouped_rleaky_step_fused,
+)
+
+
+@pytest.fixture(scope="module")
+def input_seq():
+    return torch.rand(5, 3, 2, 4) * 2
+
+
+@pytest.fixture(scope="module")
+def grouped_hidden_instance():
+    return snn.GroupedRLeaky(
+        beta=0.5, num_layers=3, num_neurons=4, init_hidden=True
+    )
+
+
+def _rleaky_layers(grouped, **kwargs):
+    """Builds the separate RLeaky layers that `grouped` stacks."""
+    layers = []
+    for layer in range(grouped.num_layers):
+        beta = grouped.beta[layer].flatten()
+        if grouped.all_to_all:
+            lif = snn.RLeaky(
+                beta=beta, linear_features=grouped.num_neurons, **kwargs
+            )
+            lif.recurrent.weight.data = grouped.V[layer].clone()
+            lif.recurrent.bias.data.zero_()
+        else:
+            V = grouped.V[layer].flatten()
+            lif = snn.RLeaky(beta=beta, V=V, all_to_all=False, **kwargs)
+        layers.append(lif)
+    return layers
+
+
+class TestGroupedRLeaky:
+    @pytest.mark.parametrize("all_to_all", [True, False])
+    @pytest.mark.parametrize("reset_mechanism", ["subtract", "zero", "none"])
+    def test_grouped_matches_rleaky(
+        self, input_seq, all_to_all, reset_mechanism
+    ):
+        grouped = snn.GroupedRLeaky(
+            beta=torch.rand(3, 4),
+            num_layers=3,
+            num_neurons=4,
+            V=torch.rand(3),
+            all_to_all=all_to_all,
+            reset_mechanism=reset_mechanism,
+        )
+        layers = _rleaky_layers(grouped, reset_mechanism=reset_mechanism)
+
+        spk, mem = grouped.reset_mem()
+        states = [lif.reset_mem() for lif in layers]
+        for step in range(input_seq.size(0)):
+            spk, mem = grouped(input_seq[step], spk, mem)
+            states = [
+                lif(input_seq[step][layer], *states[layer])
+                for layer, lif in enumerate(layers)
+            ]
+
+            assert torch.equal(spk, torch.stack([s[0] for s in states]))
+            assert torch.allclose(mem, torch.stack([s[1] for s in states]))
+
+    def test_grouped_list_input(self, input_seq):
+        grouped = snn.GroupedRLeaky(beta=0.5, num_layers=3, num_neurons=4)
+
+        spk, mem = grouped(list(input_seq[0]))
+
+        assert spk.shape == mem.shape == input_seq[0].shape
+
+    def test_grouped_shapes(self):
+        grouped = snn.GroupedRLeaky(
+            beta=torch.rand(3), num_layers=3, num_neurons=4, all_to_all=False
+        )
+
+        assert grouped.beta.shape == grouped.V.shape == (3, 1, 1)
+
+        with pytest.raises(ValueError):
+            snn.GroupedRLeaky(beta=torch.rand(2), num_layers=3, num_neurons=4)
+
+        with pytest.raises(ValueError):
+            snn.GroupedRLeaky(
+                beta=torch.rand(3, 2), num_layers=3, num_neurons=4
+            )
+
+    def test_grouped_init_hidden(self, grouped_hidden_instance, input_seq):
+        spk = grouped_hidden_instance(input_seq[0])
+
+        assert spk.shape == input_seq[0].shape
+
+        with pytest.raises(TypeError):
+            grouped_hidden_instance(
+                input_seq[0], grouped_hidden_instance.spk, None
+            )
+
+    def test_grouped_reset_hidden(self, grouped_hidden_instance, input_seq):
+        net = torch.nn.Sequential(grouped_hidden_instance)
+        net(input_seq[0] + 2)
+        utils.reset(net)
+
+        assert torch.all(grouped_hidden_instance.mem == 0)
+        assert torch.all(grouped_hidden_instance.spk == 0)
+
+    def test_grouped_fused_step(self, input_seq):
+        beta, threshold = torch.full((3, 1, 4), 0.5), torch.tensor(1.0)
+        reset = (input_seq[0] > 1).float()
+        spk, mem = reset.roll(1, -1), input_seq[1]
+
+        for V in [torch.rand(3, 4, 4), torch.rand(3, 1, 4)]:
+            args = (beta, V, threshold, 1.0, 0.0, reset, spk, mem)
+            assert torch.allclose(
+                _grouped_rleaky_step(*args, input_seq[2]),
+                _grouped_rleaky_step_fused(*args, input_seq[2]),
+            )
@@ -6,6 +6,14 @@ import pytest
 import snntorch as snn
 import torch
 import torch._dynamo as dynamo
+from snntorch._neurons.neurons import _compile
+from snntorch._neurons.rleaky import (
+    _rleaky_scan,
+    _rleaky_step,
+    _rleaky_step_fused,
+    _rleaky_step_inhibition,
+    _rleaky_step_inhibition_fused,
+)
 
 
 @pytest.fixture(scope="module")
@@ -104,6 +112,93 @@ class TestRLeaky:
         assert lif2.reset_mechanism_val == 2
         assert lif3.reset_mechanism_val == 0
 
+    def test_rleaky_reset_coeff(self):
+        lif = snn.RLeaky(beta=0.5, all_to_all=False)
+        assert lif._sub_coeff == 1 and lif._zero_coeff == 0
+
+        lif.reset_mechanism = "zero"
+        assert lif._sub_coeff == 0 and lif._zero_coeff == 1
+
+        lif.reset_mechanism = "none"
+        assert lif._sub_coeff == 0 and lif._zero_coeff == 0
+
+    def test_rleaky_reset_zero_values(self):
+        lif = snn.RLeaky(
+            beta=0.5, V=0.5, all_to_all=False, reset_mechanism="zero"
+        )
+        spk, mem = lif.init_rleaky()
+
+        spk, mem = lif(torch.Tensor([[1.5]]), spk, mem)
+        assert spk == 1 and mem == 1.5
+
+        spk, mem = lif(torch.Tensor([[0.25]]), spk, mem)
+        assert mem == 0
+
+    def test_rleaky_beta_clamp(self):
+        lif = snn.RLeaky(beta=1.5, all_to_all=False)
+        assert lif.beta == 1 and not isinstance(lif.beta, torch.nn.Parameter)
+
+        lif = snn.RLeaky(beta=1.5, all_to_all=False, learn_beta=True)
+        assert lif.beta == 1.5 and isinstance(lif.beta, torch.nn.Parameter)
+
+        # a frozen learnable decay rate is still clipped in the forward-pass
+        lif = snn.RLeaky(
+            beta=1.5, V=0.0, all_to_all=False, learn_beta=True, threshold=10
+        )
+        lif.beta.requires_grad_(False)
+        spk, mem = lif.init_rleaky()
+        for step in range(2):
+            spk, mem = lif(torch.Tensor([[0.5]]), spk, mem)
+        assert mem == 1
+
+        # so is a constant decay rate loaded from a state dict
+        lif = snn.RLeaky(beta=0.5, all_to_all=False)
+        state_dict = lif.state_dict()
+        state_dict["beta"] = torch.tensor(1.5)
+        lif.load_state_dict(state_dict)
+        assert lif.beta == 1 and state_dict["beta"] == 1.5
+
+    def test_rleaky_learn_threshold_grad(self):
+        lif = snn.RLeaky(beta=0.5, linear_features=2, learn_threshold=True)
+        spk, mem = lif.init_rleaky()
+        for step in range(3):
+            spk, mem = lif(torch.Tensor([[1.5, 0.5]]), spk, mem)
+        mem.sum().backward()
+
+        assert lif.threshold.grad is not None
+
+    def test_rleaky_reset_reuses_spike(self):
+        lif = snn.RLeaky(beta=0.5, V=0.5, all_to_all=False)
+        spk, mem = lif.init_rleaky()
+
+        spk, mem = lif(torch.Tensor([[1.5]]), spk, mem)
+        assert lif._next_reset_key[0] is mem and lif._next_reset == 1
+
+        spk, mem = lif(torch.Tensor([[0.0]]), spk, mem)
+        assert lif.reset == 1 and mem == 0.75 + 0.5 - 1
+
+        # externally provided state falls back to comparing afresh
+        spk, mem = lif(torch.Tensor([[0.0]]), spk, torch.Tensor([[2.0]]))
+        assert lif.reset == 1 and mem == 1.0 + 0.0 - 1
+
+    def test_rleaky_reset_modified_in_place(self):
+        lif = snn.RLeaky(beta=0.5, V=0.0, all_to_all=False, init_hidden=True)
+        lif(torch.Tensor([[1.5]]))
+        lif.mem.zero_()
+        lif(torch.Tensor([[0.0]]))
+        assert lif.reset == 0 and lif.mem == 0
+
+        # e.g. by an optimizer step in truncated backpropagation
+        lif = snn.RLeaky(
+            beta=0.5, V=0.0, all_to_all=False, learn_threshold=True
+        )
+        spk, mem = lif.init_rleaky()
+        spk, mem = lif(torch.Tensor([[1.5]]), spk, mem)
+        with torch.no_grad():
+            lif.threshold.fill_(2)
+        spk, mem = lif(torch.Tensor([[0.0]]), spk, mem)
+        assert lif.reset == 0 and mem == 0.75
+
     def test_rleaky_init_hidden(self, rleaky_hidden_instance, input_):
 
         spk_rec = []
@@ -138,6 +233,44 @@ class TestRLeaky:
 
         assert spk_rec[0] == spk_rec[1]
 
+    def test_rleaky_reset_detach_hidden(self):
+        lif = snn.RLeaky(beta=0.5, linear_features=3, init_hidden=True)
+        lif(torch.rand(2, 3) * 2)
+        assert lif.mem.requires_grad
+
+        snn.RLeaky.detach_hidden()
+        assert not lif.spk.requires_grad and not lif.mem.requires_grad
+
+        mem = lif.mem
+        snn.RLeaky.reset_hidden()
+        assert lif.spk.shape == lif.mem.shape == (2, 3)
+        assert not lif.spk.any() and not lif.mem.any()
+        # states held elsewhere are left intact
+        assert lif.mem is not mem and mem.any()
+
+    def test_rleaky_reset_hidden_attached(self):
+        lif = snn.RLeaky(beta=0.5, linear_features=3, init_hidden=True)
+        lif(torch.rand(2, 3) * 2)
+        mem = lif.mem
+
+        snn.RLeaky.reset_hidden()
+        assert not lif.mem.any()
+        # states still needed by the backward pass are left intact
+        assert lif.mem is not mem and mem.any()
+
+    def test_rleaky_reset_hidden_no_grad(self):
+        lif = snn.RLeaky(
+            beta=0.5, linear_features=3, init_hidden=True, output=True
+        )
+        with torch.no_grad():
+            spk, mem = lif(torch.rand(2, 3) * 2)
+            mem_rec = mem.clone()
+            snn.RLeaky.reset_hidden()
+
+        assert not lif.mem.any()
+        # a recorded state survives resetting the neuron
+        assert torch.equal(mem, mem_rec)
+
     def test_lreaky_cases(self, rleaky_hidden_instance, input_):
         with pytest.raises(TypeError):
             rleaky_hidden_instance(input_, input_, input_)
@@ -146,3 +279,227 @@ class TestRLeaky:
         explanation = dynamo.explain(rleaky_instance_surrogate)(input_[0])
 
         assert explanation.graph_break_count == 0
+
+    def test_rleaky_fused_step(self):
+        beta, threshold = torch.tensor(0.5), torch.tensor(1.0)
+        reset = torch.Tensor([[1.0, 0.0, 1.0]])
+        mem = torch.Tensor([[1.5, 0.5, 2.0]])
+        recurrent = torch.Tensor([[0.5, 0.0, 0.5]])
+        input_ = torch.Tensor([[0.25, 0.25, 0.0]])
+
+        for coeffs in [(1.0, 0.0), (0.0, 1.0), (0.0, 0.0)]:
+            args = (beta, threshold, *coeffs, reset, mem)
+            assert torch.allclose(
+                _rleaky_step(*args, recurrent, input_),
+                _rleaky_step_fused(*args, recurrent, input_),
+            )
+
+    def test_rleaky_forward_sequence(self):
+        input_seq = torch.rand(5, 2, 3) * 2
+        lif = snn.RLeaky(beta=0.5, linear_features=3)
+
+        spk, mem = lif.init_rleaky()
+        spk_rec, mem_rec = [], []
+        for step in range(5):
+            spk, mem = lif(input_seq[step], spk, mem)
+            spk_rec.append(spk)
+            mem_rec.append(mem)
+
+        spk, mem = lif.init_rleaky()
+        spk_seq, mem_seq = lif.forward_sequence(input_seq, spk, mem)
+
+        assert spk_seq.shape == mem_seq.shape == input_seq.shape
+        assert torch.equal(spk_seq, torch.stack(spk_rec))
+        assert torch.allclose(mem_seq, torch.stack(mem_rec))
+
+    def test_rleaky_scan_fullgraph(self, rleaky_instance_surrogate):
+        input_seq = torch.rand(4, 2, 1)
+        explanation = dynamo.explain(_rleaky_scan)(
+            rleaky_instance_surrogate, input_seq
+        )
+
+        assert explanation.graph_break_count == 0
+
+    def test_rleaky_capture_graph_cpu(self):
+        lif = snn.RLeaky(beta=0.5, linear_features=3)
+
+        with pytest.raises(ValueError):
+            lif.capture_graph(5, torch.rand(2, 3))
+
+        with pytest.raises(RuntimeError):
+            lif.forward_captured(torch.rand(5, 2, 3))
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+    def test_rleaky_forward_captured(self):
+        input_seq = torch.rand(5, 2, 3, device="cuda") * 2
+        lif = snn.RLeaky(beta=0.5, linear_features=3).cuda()
+
+        spk, mem = lif.init_rleaky()
+        with torch.no_grad():
+            spk_seq, mem_seq = lif.forward_sequence(input_seq, spk, mem)
+
+        lif.capture_graph(5, input_seq[0])
+        spk_cap, mem_cap = lif.forward_captured(input_seq)
+
+        assert torch.equal(spk_cap, spk_seq)
+        assert torch.allclose(mem_cap, mem_seq)
+
+    def test_rleaky_state_follows_input(self):
+        lif = snn.RLeaky(beta=0.5, all_to_all=False).double()
+        input_ = torch.rand(2, 3, dtype=torch.double)
+
+        spk, mem = lif(input_)
+
+        assert mem.dtype == torch.double
+        assert spk.shape == mem.shape == input_.shape
+
+    def test_rleaky_reduced_precision(self):
+        input_seq = torch.rand(5, 2, 3) * 2
+        for kwargs in [
+            dict(all_to_all=False, V=torch.rand(3, 3), recurrent_matrix=True),
+            dict(linear_features=3),
+        ]:
+            lif = snn.RLeaky(beta=0.95, learn_recurrent=False, **kwargs)
+            lif_bf16 = snn.RLeaky(
+                beta=0.95,
+                learn_recurrent=False,
+                dtype=torch.bfloat16,
+                **kwargs,
+            )
+            lif_bf16.load_state_dict(lif.state_dict())
+
+            assert lif_bf16._autocast
+            # the decay rate is not rounded to reduced precision
+            assert lif_bf16.beta.dtype == torch.float
+            for param in lif_bf16.recurrent.parameters():
+                assert param.dtype == torch.bfloat16
+            if not lif_bf16.all_to_all:
+                assert lif_bf16.recurrent.V is lif_bf16.V
+                assert lif_bf16.V.dtype == torch.bfloat16
+
+            mem_seq = lif.forward_sequence(input_seq)[1]
+            mem_bf16 = lif_bf16.forward_sequence(input_seq)[1]
+
+            assert mem_bf16.dtype == torch.float
+            assert torch.allclose(mem_bf16, mem_seq, atol=5e-2)
+
+        # an elementwise recurrence is left in full precision
+        lif = snn.RLeaky(
+            beta=0.5,
+            all_to_all=False,
+            learn_recurrent=False,
+            dtype=torch.bfloat16,
+        )
+        assert not lif._autocast
+        assert lif.beta.dtype == lif.V.dtype == torch.float
+
+    def test_rleaky_matrix_V(self):
+        input_seq = torch.rand(5, 2, 3) * 2
+        V = torch.rand(3, 3)
+        lif = snn.RLeaky(
+            beta=0.5, V=V, all_to_all=False, recurrent_matrix=True
+        )
+        lif_linear = snn.RLeaky(beta=0.5, linear_features=3)
+        lif_linear.recurrent.weight.data = V.clone()
+        lif_linear.recurrent.bias.data.zero_()
+
+        spk_seq, mem_seq = lif.forward_sequence(input_seq)
+        spk_linear, mem_linear = lif_linear.forward_sequence(input_seq)
+
+        assert torch.equal(spk_seq, spk_linear)
+        assert torch.allclose(mem_seq, mem_linear)
+
+        # a reduced precision matrix V with a learnable decay rate
+        for V_ in [V, V.bfloat16()]:
+            lif = snn.RLeaky(
+                beta=0.5,
+                V=V_,
+                all_to_all=False,
+                recurrent_matrix=True,
+                learn_beta=True,
+                learn_recurrent=False,
+                dtype=torch.bfloat16,
+            )
+            mem_bf16 = lif.forward_sequence(input_seq)[1]
+            assert mem_bf16.dtype == torch.float
+            assert torch.allclose(mem_bf16, mem_seq, atol=5e-2)
+
+    def test_rleaky_square_V_elementwise(self):
+        # without `recurrent_matrix`, a square V is an elementwise weight,
+        # e.g. one per pixel of a spatial input
+        input_seq = torch.rand(5, 2, 4, 4) * 2
+        V = torch.rand(4, 4)
+        lif = snn.RLeaky(beta=0.5, V=V, all_to_all=False)
+        lif_flat = snn.RLeaky(beta=0.5, V=V.flatten(), all_to_all=False)
+
+        mem_seq = lif.forward_sequence(input_seq)[1]
+        mem_flat = lif_flat.forward_sequence(input_seq.flatten(-2))[1]
+
+        assert torch.equal(mem_seq.flatten(-2), mem_flat)
+
+        with pytest.raises(ValueError):
+            snn.RLeaky(
+                beta=0.5,
+                V=torch.rand(1, 4),
+                all_to_all=False,
+                recurrent_matrix=True,
+            )
+
+    @pytest.mark.parametrize("reset_mechanism", ["subtract", "zero", "none"])
+    def test_rleaky_no_reset_delay_fullgraph(self, reset_mechanism):
+        lif = snn.RLeaky(
+            beta=0.5,
+            V=0.5,
+            all_to_all=False,
+            reset_mechanism=reset_mechanism,
+            reset_delay=False,
+            surrogate_disable=True,
+        )
+        explanation = dynamo.explain(lif)(torch.rand(2, 3) * 2)
+
+        assert explanation.graph_break_count == 0
+
+    def test_rleaky_inhibition(self):
+        lif = snn.RLeaky(beta=0.5, V=0.5, all_to_all=False, inhibition=True)
+        spk, mem = lif(torch.Tensor([[1.5, 2.5, 0.5], [2.0, 0.0, 1.5]]))
+
+        assert torch.equal(spk, torch.Tensor([[0, 1, 0], [1, 0, 0]]))
+
+    def test_rleaky_fused_step_inhibition(self):
+        spike_grad = snn.surrogate.atan()
+        beta, threshold = torch.tensor(0.5), torch.tensor(1.0)
+        reset = torch.Tensor([[1.0, 0.0, 1.0]])
+        mem = torch.Tensor([[1.5, 0.5, 2.0]])
+        recurrent = torch.Tensor([[0.5, 0.0, 0.5]])
+        input_ = torch.Tensor([[0.25, 1.25, 0.0]])
+
+        args = (spike_grad, False, beta, threshold, 1.0, 0.0, reset, mem)
+        spk, mem_next = _rleaky_step_inhibition(*args, recurrent, input_)
+        spk_fused, mem_fused = _rleaky_step_inhibition_fused(
+            *args, recurrent, input_
+        )
+
+        assert torch.equal(spk, torch.Tensor([[0, 1, 0]]))
+        assert torch.equal(spk_fused, spk)
+        assert torch.allclose(mem_fused, mem_next)
+
+    def test_compile_fallback(self):
+        def failing_backend(gm, example_inputs):
+            raise RuntimeError("backend unavailable")
+
+        beta, threshold = torch.tensor(0.5), torch.tensor(1.0)
+        reset = torch.Tensor([[1.0, 0.0, 1.0]])
+        mem = torch.Tensor([[1.5, 0.5, 2.0]])
+        args = (beta, threshold, 1.0, 0.0, reset, mem, mem, mem)
+
+        step_fn = _compile(_rleaky_step, backend=failing_backend)
+        with pytest.warns(RuntimeWarning):
+            out = step_fn(*args)
+
+        assert step_fn.eager
+        assert torch.equal(out, _rleaky_step(*args))
+        # errors the eager function raises too are not swallowed
+        step_fn = _compile(_rleaky_step)
+        with pytest.raises(RuntimeError):
+            step_fn(beta, threshold, 1.0, 0.0, reset, mem, mem[:, :2], mem)
+        assert not step_fn.eager
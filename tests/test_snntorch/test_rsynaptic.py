@@ -6,6 +6,11 @@ import pytest
 import snntorch as snn
 import torch
 import torch._dynamo as dynamo
+from snntorch._neurons.rsynaptic import (
+    _rsynaptic_scan,
+    _rsynaptic_step,
+    _rsynaptic_step_fused,
+)
 
 
 @pytest.fixture(scope="module")
@@ -115,6 +120,60 @@ class TestRSynaptic:
         assert lif2.reset_mechanism_val == 2
         assert lif3.reset_mechanism_val == 0
 
+    def test_rsynaptic_reset_coeff(self):
+        lif = snn.RSynaptic(alpha=0.5, beta=0.5, all_to_all=False)
+        assert lif._sub_coeff == 1 and lif._zero_coeff == 0
+
+        lif.reset_mechanism = "zero"
+        assert lif._sub_coeff == 0 and lif._zero_coeff == 1
+
+        lif.reset_mechanism = "none"
+        assert lif._sub_coeff == 0 and lif._zero_coeff == 0
+
+    def test_rsynaptic_reset_zero_values(self):
+        lif = snn.RSynaptic(
+            alpha=0.5,
+            beta=0.5,
+            V=0.5,
+            all_to_all=False,
+            reset_mechanism="zero",
+        )
+        spk, syn, mem = lif.init_rsynaptic()
+
+        spk, syn, mem = lif(torch.Tensor([[1.5]]), spk, syn, mem)
+        assert spk == 1 and syn == 1.5 and mem == 1.5
+
+        # only the membrane potential is reset
+        spk, syn, mem = lif(torch.Tensor([[0.25]]), spk, syn, mem)
+        assert syn == 1.5 and mem == 0
+
+    def test_rsynaptic_decay_clamp(self):
+        lif = snn.RSynaptic(alpha=-0.5, beta=1.5, all_to_all=False)
+        assert lif.alpha == 0 and lif.beta == 1
+
+        lif_learned = snn.RSynaptic(
+            alpha=-0.5,
+            beta=1.5,
+            all_to_all=False,
+            learn_alpha=True,
+            learn_beta=True,
+        )
+        assert lif_learned.alpha == -0.5 and lif_learned.beta == 1.5
+
+        # constant decay rates loaded from a state dict are clipped too
+        lif = snn.RSynaptic(alpha=0.5, beta=0.5, all_to_all=False)
+        lif.load_state_dict(lif_learned.state_dict())
+        assert lif.alpha == 0 and lif.beta == 1
+
+    def test_rsynaptic_no_reset_delay(self):
+        lif = snn.RSynaptic(
+            alpha=0.5, beta=0.5, V=0.5, all_to_all=False, reset_delay=False
+        )
+        spk, syn, mem = lif.init_rsynaptic()
+
+        spk, syn, mem = lif(torch.Tensor([[1.5]]), spk, syn, mem)
+        assert spk == 1 and syn == 1.5 and mem == 0.5
+
     def test_rsynaptic_init_hidden(self, rsynaptic_hidden_instance, input_):
 
         spk_rec = []
@@ -149,6 +208,25 @@ class TestRSynaptic:
 
         assert spk_rec[0] == spk_rec[1]
 
+    def test_rsynaptic_reset_detach_hidden(self):
+        lif = snn.RSynaptic(
+            alpha=0.5, beta=0.5, linear_features=3, init_hidden=True
+        )
+        lif(torch.rand(2, 3) * 2)
+        assert lif.syn.requires_grad and lif.mem.requires_grad
+
+        snn.RSynaptic.detach_hidden()
+        assert not lif.spk.requires_grad
+        assert not lif.syn.requires_grad and not lif.mem.requires_grad
+
+        syn, mem = lif.syn, lif.mem
+        snn.RSynaptic.reset_hidden()
+        assert lif.spk.shape == lif.syn.shape == lif.mem.shape == (2, 3)
+        assert not lif.spk.any() and not lif.syn.any() and not lif.mem.any()
+        # states held elsewhere are left intact
+        assert lif.syn is not syn and lif.mem is not mem
+        assert syn.any() and mem.any()
+
     def test_rsynaptic_cases(self, rsynaptic_hidden_instance, input_):
         with pytest.raises(TypeError):
             rsynaptic_hidden_instance(input_, input_)
@@ -159,3 +237,177 @@ class TestRSynaptic:
         explanation = dynamo.explain(rsynaptic_instance_surrogate)(input_[0])
 
         assert explanation.graph_break_count == 0
+
+    def test_rsynaptic_step_fullgraph(self):
+        state = torch.rand(2, 3)
+        scalar = torch.tensor(0.5)
+        explanation = dynamo.explain(_rsynaptic_step)(
+            scalar, scalar, scalar, 1.0, 0.0, state, state, state, state, state
+        )
+
+        assert explanation.graph_break_count == 0
+
+    def test_rsynaptic_fused_step(self):
+        alpha, beta = torch.tensor(0.5), torch.tensor(0.5)
+        threshold = torch.tensor(1.0)
+        reset = torch.Tensor([[1.0, 0.0, 1.0]])
+        syn = torch.Tensor([[0.5, 0.25, 1.0]])
+        mem = torch.Tensor([[1.5, 0.5, 2.0]])
+        recurrent = torch.Tensor([[0.5, 0.0, 0.5]])
+        input_ = torch.Tensor([[0.25, 0.25, 0.0]])
+
+        for coeffs in [(1.0, 0.0), (0.0, 1.0), (0.0, 0.0)]:
+            args = (alpha, beta, threshold, *coeffs, reset)
+            for eager, fused in zip(
+                _rsynaptic_step(*args, syn, mem, recurrent, input_),
+                _rsynaptic_step_fused(*args, syn, mem, recurrent, input_),
+            ):
+                assert torch.allclose(eager, fused)
+
+    def test_rsynaptic_forward_sequence(self):
+        input_seq = torch.rand(5, 2, 3) * 2
+        lif = snn.RSynaptic(alpha=0.5, beta=0.5, linear_features=3)
+
+        spk, syn, mem = lif.init_rsynaptic()
+        spk_rec, syn_rec, mem_rec = [], [], []
+        for step in range(5):
+            spk, syn, mem = lif(input_seq[step], spk, syn, mem)
+            spk_rec.append(spk)
+            syn_rec.append(syn)
+            mem_rec.append(mem)
+
+        spk, syn, mem = lif.init_rsynaptic()
+        spk_seq, syn_seq, mem_seq = lif.forward_sequence(
+            input_seq, spk, syn, mem
+        )
+
+        assert spk_seq.shape == mem_seq.shape == input_seq.shape
+        assert torch.equal(spk_seq, torch.stack(spk_rec))
+        assert torch.allclose(syn_seq, torch.stack(syn_rec))
+        assert torch.allclose(mem_seq, torch.stack(mem_rec))
+
+    def test_rsynaptic_scan_fullgraph(self, rsynaptic_instance_surrogate):
+        input_seq = torch.rand(4, 2, 1)
+        explanation = dynamo.explain(_rsynaptic_scan)(
+            rsynaptic_instance_surrogate, input_seq
+        )
+
+        assert explanation.graph_break_count == 0
+
+    def test_rsynaptic_capture_graph_cpu(self):
+        lif = snn.RSynaptic(alpha=0.5, beta=0.5, linear_features=3)
+
+        with pytest.raises(ValueError):
+            lif.capture_graph(5, torch.rand(2, 3))
+
+        with pytest.raises(RuntimeError):
+            lif.forward_captured(torch.rand(5, 2, 3))
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+    def test_rsynaptic_forward_captured(self):
+        input_seq = torch.rand(5, 2, 3, device="cuda") * 2
+        lif = snn.RSynaptic(alpha=0.5, beta=0.5, linear_features=3).cuda()
+
+        spk, syn, mem = lif.init_rsynaptic()
+        with torch.no_grad():
+            out_seq = lif.forward_sequence(input_seq, spk, syn, mem)
+
+        lif.capture_graph(5, input_seq[0])
+        out_cap = lif.forward_captured(input_seq)
+
+        assert torch.equal(out_cap[0], out_seq[0])
+        assert torch.allclose(out_cap[1], out_seq[1])
+        assert torch.allclose(out_cap[2], out_seq[2])
+
+    def test_rsynaptic_state_follows_input(self):
+        lif = snn.RSynaptic(alpha=0.5, beta=0.5, all_to_all=False).double()
+        input_ = torch.rand(2, 3, dtype=torch.double)
+
+        spk, syn, mem = lif(input_)
+
+        assert syn.dtype == mem.dtype == torch.double
+        assert spk.shape == syn.shape == mem.shape == input_.shape
+
+    def test_rsynaptic_reduced_precision(self):
+        input_seq = torch.rand(5, 2, 3) * 2
+        lif = snn.RSynaptic(
+            alpha=0.5, beta=0.5, linear_features=3, learn_recurrent=False
+        )
+        lif_bf16 = snn.RSynaptic(
+            alpha=0.5,
+            beta=0.5,
+            linear_features=3,
+            learn_recurrent=False,
+            dtype=torch.bfloat16,
+        )
+        lif_bf16.load_state_dict(lif.state_dict())
+
+        assert lif_bf16._autocast
+        assert lif_bf16.alpha.dtype == lif_bf16.beta.dtype == torch.float
+        assert lif_bf16.recurrent.weight.dtype == torch.bfloat16
+
+        out_seq = lif.forward_sequence(input_seq)
+        out_bf16 = lif_bf16.forward_sequence(input_seq)
+
+        for state, state_bf16 in zip(out_seq[1:], out_bf16[1:]):
+            assert state_bf16.dtype == torch.float
+            assert torch.allclose(state_bf16, state, atol=5e-2)
+
+        lif = snn.RSynaptic(
+            alpha=0.5, beta=0.5, all_to_all=False, dtype=torch.bfloat16
+        )
+        assert not lif._autocast
+        assert lif.alpha.dtype == lif.beta.dtype == lif.V.dtype == torch.float
+
+    def test_rsynaptic_matrix_V(self):
+        input_seq = torch.rand(5, 2, 3) * 2
+        V = torch.rand(3, 3)
+        lif = snn.RSynaptic(
+            alpha=0.5, beta=0.5, V=V, all_to_all=False, recurrent_matrix=True
+        )
+        lif_linear = snn.RSynaptic(alpha=0.5, beta=0.5, linear_features=3)
+        lif_linear.recurrent.weight.data = V.clone()
+        lif_linear.recurrent.bias.data.zero_()
+
+        out_seq = lif.forward_sequence(input_seq)
+        out_linear = lif_linear.forward_sequence(input_seq)
+
+        assert torch.equal(out_seq[0], out_linear[0])
+        assert torch.allclose(out_seq[1], out_linear[1])
+        assert torch.allclose(out_seq[2], out_linear[2])
+
+    @pytest.mark.parametrize("reset_mechanism", ["subtract", "zero", "none"])
+    def test_rsynaptic_no_reset_delay_fullgraph(self, reset_mechanism):
+        lif = snn.RSynaptic(
+            alpha=0.5,
+            beta=0.5,
+            V=0.5,
+            all_to_all=False,
+            reset_mechanism=reset_mechanism,
+            reset_delay=False,
+            surrogate_disable=True,
+        )
+        explanation = dynamo.explain(lif)(torch.rand(2, 3) * 2)
+
+        assert explanation.graph_break_count == 0
+
+    def test_rsynaptic_inhibition(self):
+        lif = snn.RSynaptic(
+            alpha=0.5, beta=0.5, V=0.5, all_to_all=False, inhibition=True
+        )
+        spk, syn, mem = lif(torch.Tensor([[1.5, 2.5, 0.5], [2.0, 0.0, 1.5]]))
+
+        assert torch.equal(spk, torch.Tensor([[0, 1, 0], [1, 0, 0]]))
+
+    def test_rsynaptic_inhibition_fullgraph(self):
+        lif = snn.RSynaptic(
+            alpha=0.5,
+            beta=0.5,
+            V=0.5,
+            all_to_all=False,
+            inhibition=True,
+            surrogate_disable=True,
+        )
+        explanation = dynamo.explain(lif)(torch.rand(2, 3) * 2)
+
+        assert explanation.graph_break_count == 0